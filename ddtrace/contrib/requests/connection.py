@@ -8,10 +8,55 @@ from ...constants import SPAN_MEASURED_KEY
 from ...ext import SpanTypes
 from ...internal.logger import get_logger
 from ...propagation.http import HTTPPropagator
+from ...utils.cache import cached
 
 
 log = get_logger(__name__)
 
+# Name used for every span produced by this integration; a single module-level
+# string keeps one shared (interned) object across all requests.
+_REQUEST_SPAN_NAME = "requests.request"
+
+# Pre-computed uppercased HTTP methods: a dict lookup is cheaper than calling
+# str.upper() on one of the ~9 canonical verbs for every traced request.
+_METHOD_UPPER = {m: m for m in ("GET", "POST", "PUT", "DELETE", "HEAD", "OPTIONS", "PATCH", "TRACE", "CONNECT")}
+_METHOD_UPPER.update({m.lower(): m for m in list(_METHOD_UPPER)})
+
+
+@cached(maxsize=1024)
+def _parse_url(url):
+    # type: (str) -> parse.ParseResult
+    """Parse an URL, caching the result.
+
+    Applications tend to request the same URLs over and over again, so avoid
+    re-tokenizing identical URL strings on every traced request.
+    """
+    return parse.urlparse(url)
+
+
+def _set_request_tags(span, request, parsed_uri, url, headers, response):
+    """Set the http meta on the request span; never raises."""
+    try:
+        status = None
+        response_headers = None
+        if response is not None:
+            status = response.status_code
+            # response.headers is not a dict, but an iterable requests custom
+            # structure; set_http_meta converts it to a dict itself
+            response_headers = getattr(response, "headers", None)
+        trace_utils.set_http_meta(
+            span,
+            config.requests,
+            method=_METHOD_UPPER.get(request.method) or request.method.upper(),
+            url=url,
+            status_code=status,
+            query=parsed_uri.query,
+            request_headers=headers,
+            response_headers=response_headers,
+        )
+    except Exception:
+        log.debug("requests: error adding tags", exc_info=True)
+
 
 def _wrap_send(func, instance, args, kwargs):
     """Trace the `Session.send` instance method"""
@@ -19,7 +64,9 @@ def _wrap_send(func, instance, args, kwargs):
     # and is ddtrace.tracer; it's used only inside our tests and can
     # be easily changed by providing a TracingTestCase that sets common
     # tracing functionalities.
-    tracer = getattr(instance, "datadog_tracer", ddtrace.tracer)
+    # DEV: a per-session tracer must be set on the instance dict; a plain
+    # dict.get is cheaper than the full attribute protocol of getattr()
+    tracer = instance.__dict__.get("datadog_tracer") or ddtrace.tracer
 
     # skip if tracing is not enabled
     if not tracer.enabled:
@@ -29,7 +76,10 @@ def _wrap_send(func, instance, args, kwargs):
     if not request:
         return func(*args, **kwargs)
 
-    parsed_uri = parse.urlparse(request.url)
+    url = request.url
+    headers = request.headers
+
+    parsed_uri = _parse_url(url)
     hostname = parsed_uri.hostname
     if parsed_uri.port:
         hostname = "{}:{}".format(hostname, parsed_uri.port)
@@ -45,50 +95,24 @@ def _wrap_send(func, instance, args, kwargs):
     if service is None:
         service = trace_utils.ext_service(None, config.requests)
 
-    with tracer.trace("requests.request", service=service, span_type=SpanTypes.HTTP) as span:
+    with tracer.trace(_REQUEST_SPAN_NAME, service=service, span_type=SpanTypes.HTTP) as span:
         span.set_tag(SPAN_MEASURED_KEY)
 
         # Configure trace search sample rate
         # DEV: analytics enabled on per-session basis
-        cfg = config.get_from(instance)
         analytics_enabled = cfg.get("analytics_enabled")
         if analytics_enabled:
             span.set_tag(ANALYTICS_SAMPLE_RATE_KEY, cfg.get("analytics_sample_rate", True))
 
         # propagate distributed tracing headers
         if cfg.get("distributed_tracing"):
-            HTTPPropagator.inject(span.context, request.headers)
+            HTTPPropagator.inject(span.context, headers)
 
-        response = None
         try:
             response = func(*args, **kwargs)
-
-            # Storing response headers in the span. Note that response.headers is not a dict, but an iterable
-            # requests custom structure, that we convert to a dict
-            if hasattr(response, "headers"):
-                response_headers = response.headers
-            else:
-                response_headers = None
-            trace_utils.set_http_meta(
-                span, config.requests, request_headers=request.headers, response_headers=response_headers
-            )
-            return response
-        finally:
-            try:
-                status = None
-                if response is not None:
-                    status = response.status_code
-                    # Storing response headers in the span.
-                    # Note that response.headers is not a dict, but an iterable
-                    # requests custom structure, that we convert to a dict
-                    response_headers = dict(getattr(response, "headers", {}))
-                trace_utils.set_http_meta(
-                    span,
-                    config.requests,
-                    method=request.method.upper(),
-                    url=request.url,
-                    status_code=status,
-                    query=parsed_uri.query,
-                )
-            except Exception:
-                log.debug("requests: error adding tags", exc_info=True)
+        except BaseException:
+            # tag what we know before the span records the error and closes
+            _set_request_tags(span, request, parsed_uri, url, headers, None)
+            raise
+        _set_request_tags(span, request, parsed_uri, url, headers, response)
+        return response
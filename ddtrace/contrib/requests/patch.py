@@ -1,12 +1,12 @@
+import functools
+
 import requests
 
 from ddtrace import config
-from ddtrace.vendor.wrapt import wrap_function_wrapper as _w
 
 from ...pin import Pin
 from ...utils.formats import asbool
 from ...utils.formats import get_env
-from ...utils.wrappers import unwrap as _u
 from .connection import _wrap_send
 from .legacy import _distributed_tracing
 from .legacy import _distributed_tracing_setter
@@ -23,13 +23,39 @@ config._add(
 )
 
 
+def _wrap_session_send(cls):
+    """Replace ``cls.send`` with a traced version.
+
+    A plain closure is used instead of a ``wrapt`` ``FunctionWrapper`` to
+    avoid the proxy layer on every request; the original method is kept on
+    ``__wrapped__`` for introspection and unpatching.
+    """
+    original = cls.send
+
+    @functools.wraps(original)
+    def send(self, *args, **kwargs):
+        # bind the original to the session: _wrap_send calls it without `self`,
+        # mirroring the bound method wrapt used to pass along
+        return _wrap_send(original.__get__(self, cls), self, args, kwargs)
+
+    send.__wrapped__ = original
+    cls.send = send
+
+
+def _unwrap_session_send(cls):
+    """Restore the original ``cls.send`` installed by `_wrap_session_send`."""
+    original = getattr(cls.send, "__wrapped__", None)
+    if original is not None:
+        cls.send = original
+
+
 def patch():
     """Activate http calls tracing"""
     if getattr(requests, "__datadog_patch", False):
         return
     setattr(requests, "__datadog_patch", True)
 
-    _w("requests", "Session.send", _wrap_send)
+    _wrap_session_send(requests.Session)
     Pin(app="requests", _config=config.requests).onto(requests.Session)
 
     # [Backward compatibility]: `session.distributed_tracing` should point and
@@ -46,4 +72,4 @@ def unpatch():
         return
     setattr(requests, "__datadog_patch", False)
 
-    _u(requests.Session, "send")
+    _unwrap_session_send(requests.Session)
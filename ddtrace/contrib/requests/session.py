@@ -2,9 +2,8 @@ import requests
 
 from ddtrace import Pin
 from ddtrace import config
-from ddtrace.vendor.wrapt import wrap_function_wrapper as _w
 
-from .connection import _wrap_send
+from .patch import _wrap_session_send
 
 
 class TracedSession(requests.Session):
@@ -13,9 +12,12 @@ class TracedSession(requests.Session):
     HTTP clients.
     """
 
+    # DEV: do not add __slots__ here: requests.Session has none, so instances
+    # get a __dict__ either way, and a `datadog_tracer` slot would shadow the
+    # instance-dict lookup _wrap_send relies on for per-session tracers
     pass
 
 
 # always patch our `TracedSession` when imported
-_w(TracedSession, "send", _wrap_send)
+_wrap_session_send(TracedSession)
 Pin(_config=config.requests).onto(TracedSession)
@@ -1,13 +1,12 @@
-import aiobotocore
-
 from ddtrace.contrib.aiobotocore.patch import patch
 from ddtrace.contrib.aiobotocore.patch import unpatch
+from ddtrace.ext import http
 
 from ....utils import DummyTracer
 from ....utils import assert_is_measured
-from ....utils import assert_span_http_status_code
 from ...asyncio.utils import AsyncioTestCase
 from ...asyncio.utils import mark_asyncio
+from ..test import PRE_08
 from ..utils import aiobotocore_client
 
 
@@ -40,10 +39,8 @@ class AIOBotocoreTest(AsyncioTestCase):
 
         traces = self.pop_traces()
 
-        version = aiobotocore.__version__.split(".")
-        pre_08 = int(version[0]) == 0 and int(version[1]) < 8
         # Version 0.8+ generates only one span for reading an object.
-        if pre_08:
+        if PRE_08:
             assert len(traces) == 2
             assert len(traces[0]) == 1
             assert len(traces[1]) == 1
@@ -51,14 +48,14 @@ class AIOBotocoreTest(AsyncioTestCase):
             span = traces[0][0]
             assert_is_measured(span)
             assert span.get_tag("aws.operation") == "GetObject"
-            assert_span_http_status_code(span, 200)
+            assert span.get_tag(http.STATUS_CODE) == "200"
             assert span.service == "aws.s3"
             assert span.resource == "s3.getobject"
 
             read_span = traces[1][0]
             assert_is_measured(read_span)
             assert read_span.get_tag("aws.operation") == "GetObject"
-            assert_span_http_status_code(read_span, 200)
+            assert read_span.get_tag(http.STATUS_CODE) == "200"
             assert read_span.service == "aws.s3"
             assert read_span.resource == "s3.getobject"
             assert read_span.name == "s3.command.read"
@@ -72,7 +69,7 @@ class AIOBotocoreTest(AsyncioTestCase):
             span = traces[0][0]
             assert_is_measured(span)
             assert span.get_tag("aws.operation") == "GetObject"
-            assert_span_http_status_code(span, 200)
+            assert span.get_tag(http.STATUS_CODE) == "200"
             assert span.service == "aws.s3"
             assert span.resource == "s3.getobject"
             assert span.name == "s3.command"
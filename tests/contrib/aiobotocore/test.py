@@ -5,349 +5,374 @@ from ddtrace.compat import stringify
 from ddtrace.constants import ANALYTICS_SAMPLE_RATE_KEY
 from ddtrace.contrib.aiobotocore.patch import patch
 from ddtrace.contrib.aiobotocore.patch import unpatch
+from ddtrace.ext import http
 from tests.utils import DummyTracer
 from tests.utils import assert_is_measured
-from tests.utils import assert_span_http_status_code
+from tests.utils import assert_tags
+from tests.utils import tag_keys
 
 from ..asyncio.utils import AsyncioTestCase
 from ..asyncio.utils import mark_asyncio
 from .utils import aiobotocore_client
 
 
+# parse the version under test once; aiobotocore 0.8 changed how reads of
+# S3 objects are traced
+_AIOBOTOCORE_VERSION = tuple(int(part) for part in aiobotocore.__version__.split(".")[:2])
+PRE_08 = _AIOBOTOCORE_VERSION < (0, 8)
+
+
 class AIOBotocoreTest(AsyncioTestCase):
     """Botocore integration testsuite"""
 
+    @classmethod
+    def setUpClass(cls):
+        # patch once for the whole class instead of per test; isolation
+        # between tests comes from each one getting its own tracer
+        super(AIOBotocoreTest, cls).setUpClass()
+        patch()
+
+    @classmethod
+    def tearDownClass(cls):
+        unpatch()
+        super(AIOBotocoreTest, cls).tearDownClass()
+
     def setUp(self):
         super(AIOBotocoreTest, self).setUp()
-        patch()
         self.tracer = DummyTracer()
 
     def tearDown(self):
         super(AIOBotocoreTest, self).tearDown()
-        unpatch()
         self.tracer = None
 
     @mark_asyncio
-    def test_traced_client(self):
+    async def test_traced_client(self):
         with aiobotocore_client("ec2", self.tracer) as ec2:
-            yield from ec2.describe_instances()
+            await ec2.describe_instances()
 
         traces = self.pop_traces()
-        self.assertEqual(len(traces), 1)
-        self.assertEqual(len(traces[0]), 1)
+        assert len(traces) == 1
+        assert len(traces[0]) == 1
         span = traces[0][0]
 
         assert_is_measured(span)
-        self.assertEqual(span.get_tag("aws.agent"), "aiobotocore")
-        self.assertEqual(span.get_tag("aws.region"), "us-west-2")
-        self.assertEqual(span.get_tag("aws.operation"), "DescribeInstances")
-        assert_span_http_status_code(span, 200)
-        self.assertEqual(span.get_metric("retry_attempts"), 0)
-        self.assertEqual(span.service, "aws.ec2")
-        self.assertEqual(span.resource, "ec2.describeinstances")
-        self.assertEqual(span.name, "ec2.command")
-        self.assertEqual(span.span_type, "http")
-        self.assertIsNone(span.get_metric(ANALYTICS_SAMPLE_RATE_KEY))
+        assert_tags(
+            span,
+            {
+                "aws.agent": "aiobotocore",
+                "aws.region": "us-west-2",
+                "aws.operation": "DescribeInstances",
+                http.STATUS_CODE: "200",
+            },
+        )
+        assert span.get_metric("retry_attempts") == 0
+        assert span.service == "aws.ec2"
+        assert span.resource == "ec2.describeinstances"
+        assert span.name == "ec2.command"
+        assert span.span_type == "http"
+        assert span.get_metric(ANALYTICS_SAMPLE_RATE_KEY) is None
 
     @mark_asyncio
-    def test_traced_client_analytics(self):
+    async def test_traced_client_analytics(self):
         with self.override_config("aiobotocore", dict(analytics_enabled=True, analytics_sample_rate=0.5)):
             with aiobotocore_client("ec2", self.tracer) as ec2:
-                yield from ec2.describe_instances()
+                await ec2.describe_instances()
 
         spans = self.get_spans()
         assert spans
         span = spans[0]
-        self.assertEqual(span.get_metric(ANALYTICS_SAMPLE_RATE_KEY), 0.5)
+        assert span.get_metric(ANALYTICS_SAMPLE_RATE_KEY) == 0.5
 
     @mark_asyncio
-    def test_s3_client(self):
+    async def test_s3_client(self):
         with aiobotocore_client("s3", self.tracer) as s3:
-            yield from s3.list_buckets()
-            yield from s3.list_buckets()
+            await s3.list_buckets()
+            await s3.list_buckets()
 
         traces = self.pop_traces()
-        self.assertEqual(len(traces), 2)
-        self.assertEqual(len(traces[0]), 1)
+        assert len(traces) == 2
+        assert len(traces[0]) == 1
         span = traces[0][0]
 
         assert_is_measured(span)
-        self.assertEqual(span.get_tag("aws.operation"), "ListBuckets")
-        assert_span_http_status_code(span, 200)
-        self.assertEqual(span.service, "aws.s3")
-        self.assertEqual(span.resource, "s3.listbuckets")
-        self.assertEqual(span.name, "s3.command")
+        assert span.get_tag("aws.operation") == "ListBuckets"
+        assert span.get_tag(http.STATUS_CODE) == "200"
+        assert span.service == "aws.s3"
+        assert span.resource == "s3.listbuckets"
+        assert span.name == "s3.command"
 
     @mark_asyncio
-    def test_s3_put(self):
+    async def test_s3_put(self):
         params = dict(Key="foo", Bucket="mybucket", Body=b"bar")
 
         with aiobotocore_client("s3", self.tracer) as s3:
-            yield from s3.create_bucket(Bucket="mybucket")
-            yield from s3.put_object(**params)
+            await s3.create_bucket(Bucket="mybucket")
+            await s3.put_object(**params)
 
         spans = [trace[0] for trace in self.pop_traces()]
         assert spans
-        self.assertEqual(len(spans), 2)
-        self.assertEqual(spans[0].get_tag("aws.operation"), "CreateBucket")
+        assert len(spans) == 2
+        assert spans[0].get_tag("aws.operation") == "CreateBucket"
 
         assert_is_measured(spans[0])
-        assert_span_http_status_code(spans[0], 200)
-        self.assertEqual(spans[0].service, "aws.s3")
-        self.assertEqual(spans[0].resource, "s3.createbucket")
+        assert spans[0].get_tag(http.STATUS_CODE) == "200"
+        assert spans[0].service == "aws.s3"
+        assert spans[0].resource == "s3.createbucket"
 
         assert_is_measured(spans[1])
-        self.assertEqual(spans[1].get_tag("aws.operation"), "PutObject")
-        self.assertEqual(spans[1].resource, "s3.putobject")
-        self.assertEqual(spans[1].get_tag("params.Key"), stringify(params["Key"]))
-        self.assertEqual(spans[1].get_tag("params.Bucket"), stringify(params["Bucket"]))
-        self.assertIsNone(spans[1].get_tag("params.Body"))
+        assert_tags(
+            spans[1],
+            {
+                "aws.operation": "PutObject",
+                "params.Key": stringify(params["Key"]),
+                "params.Bucket": stringify(params["Bucket"]),
+            },
+        )
+        assert spans[1].resource == "s3.putobject"
+        assert "params.Body" not in tag_keys(spans[1])
 
     @mark_asyncio
-    def test_s3_client_error(self):
+    async def test_s3_client_error(self):
         with aiobotocore_client("s3", self.tracer) as s3:
             with self.assertRaises(ClientError):
                 # FIXME: add proper clean-up to tearDown
-                yield from s3.list_objects(Bucket="doesnotexist")
+                await s3.list_objects(Bucket="doesnotexist")
 
         traces = self.pop_traces()
-        self.assertEqual(len(traces), 1)
-        self.assertEqual(len(traces[0]), 1)
+        assert len(traces) == 1
+        assert len(traces[0]) == 1
         span = traces[0][0]
 
         assert_is_measured(span)
-        self.assertEqual(span.resource, "s3.listobjects")
-        self.assertEqual(span.error, 1)
-        self.assertTrue("NoSuchBucket" in span.get_tag("error.msg"))
+        assert span.resource == "s3.listobjects"
+        assert span.error == 1
+        assert "NoSuchBucket" in span.get_tag("error.msg")
 
     @mark_asyncio
-    def test_s3_client_read(self):
+    async def test_s3_client_read(self):
         with aiobotocore_client("s3", self.tracer) as s3:
             # prepare S3 and flush traces if any
-            yield from s3.create_bucket(Bucket="tracing")
-            yield from s3.put_object(Bucket="tracing", Key="apm", Body=b"")
+            await s3.create_bucket(Bucket="tracing")
+            await s3.put_object(Bucket="tracing", Key="apm", Body=b"")
             self.pop_traces()
             # calls under test
-            response = yield from s3.get_object(Bucket="tracing", Key="apm")
-            yield from response["Body"].read()
+            response = await s3.get_object(Bucket="tracing", Key="apm")
+            await response["Body"].read()
 
         traces = self.pop_traces()
-        version = aiobotocore.__version__.split(".")
-        pre_08 = int(version[0]) == 0 and int(version[1]) < 8
-        if pre_08:
-            self.assertEqual(len(traces), 2)
-            self.assertEqual(len(traces[1]), 1)
+        if PRE_08:
+            assert len(traces) == 2
+            assert len(traces[1]) == 1
         else:
-            self.assertEqual(len(traces), 1)
+            assert len(traces) == 1
 
-        self.assertEqual(len(traces[0]), 1)
+        assert len(traces[0]) == 1
 
         span = traces[0][0]
 
         assert_is_measured(span)
-        self.assertEqual(span.get_tag("aws.operation"), "GetObject")
-        assert_span_http_status_code(span, 200)
-        self.assertEqual(span.service, "aws.s3")
-        self.assertEqual(span.resource, "s3.getobject")
+        assert span.get_tag("aws.operation") == "GetObject"
+        assert span.get_tag(http.STATUS_CODE) == "200"
+        assert span.service == "aws.s3"
+        assert span.resource == "s3.getobject"
 
-        if pre_08:
+        if PRE_08:
             read_span = traces[1][0]
-            self.assertEqual(read_span.get_tag("aws.operation"), "GetObject")
-            assert_span_http_status_code(read_span, 200)
-            self.assertEqual(read_span.service, "aws.s3")
-            self.assertEqual(read_span.resource, "s3.getobject")
-            self.assertEqual(read_span.name, "s3.command.read")
+            assert read_span.get_tag("aws.operation") == "GetObject"
+            assert read_span.get_tag(http.STATUS_CODE) == "200"
+            assert read_span.service == "aws.s3"
+            assert read_span.resource == "s3.getobject"
+            assert read_span.name == "s3.command.read"
             # enforce parenting
-            self.assertEqual(read_span.parent_id, span.span_id)
-            self.assertEqual(read_span.trace_id, span.trace_id)
+            assert read_span.parent_id == span.span_id
+            assert read_span.trace_id == span.trace_id
 
     @mark_asyncio
-    def test_sqs_client(self):
+    async def test_sqs_client(self):
         with aiobotocore_client("sqs", self.tracer) as sqs:
-            yield from sqs.list_queues()
+            await sqs.list_queues()
 
         traces = self.pop_traces()
-        self.assertEqual(len(traces), 1)
-        self.assertEqual(len(traces[0]), 1)
+        assert len(traces) == 1
+        assert len(traces[0]) == 1
 
         span = traces[0][0]
 
         assert_is_measured(span)
-        self.assertEqual(span.get_tag("aws.region"), "us-west-2")
-        self.assertEqual(span.get_tag("aws.operation"), "ListQueues")
-        assert_span_http_status_code(span, 200)
-        self.assertEqual(span.service, "aws.sqs")
-        self.assertEqual(span.resource, "sqs.listqueues")
+        assert_tags(span, {"aws.region": "us-west-2", "aws.operation": "ListQueues", http.STATUS_CODE: "200"})
+        assert span.service == "aws.sqs"
+        assert span.resource == "sqs.listqueues"
 
     @mark_asyncio
-    def test_kinesis_client(self):
+    async def test_kinesis_client(self):
         with aiobotocore_client("kinesis", self.tracer) as kinesis:
-            yield from kinesis.list_streams()
+            await kinesis.list_streams()
 
         traces = self.pop_traces()
-        self.assertEqual(len(traces), 1)
-        self.assertEqual(len(traces[0]), 1)
+        assert len(traces) == 1
+        assert len(traces[0]) == 1
 
         span = traces[0][0]
 
         assert_is_measured(span)
-        self.assertEqual(span.get_tag("aws.region"), "us-west-2")
-        self.assertEqual(span.get_tag("aws.operation"), "ListStreams")
-        assert_span_http_status_code(span, 200)
-        self.assertEqual(span.service, "aws.kinesis")
-        self.assertEqual(span.resource, "kinesis.liststreams")
+        assert_tags(span, {"aws.region": "us-west-2", "aws.operation": "ListStreams", http.STATUS_CODE: "200"})
+        assert span.service == "aws.kinesis"
+        assert span.resource == "kinesis.liststreams"
 
     @mark_asyncio
-    def test_lambda_client(self):
+    async def test_lambda_client(self):
         with aiobotocore_client("lambda", self.tracer) as lambda_client:
             # https://github.com/spulec/moto/issues/906
-            yield from lambda_client.list_functions(MaxItems=5)
+            await lambda_client.list_functions(MaxItems=5)
 
         traces = self.pop_traces()
-        self.assertEqual(len(traces), 1)
-        self.assertEqual(len(traces[0]), 1)
+        assert len(traces) == 1
+        assert len(traces[0]) == 1
 
         span = traces[0][0]
 
         assert_is_measured(span)
-        self.assertEqual(span.get_tag("aws.region"), "us-west-2")
-        self.assertEqual(span.get_tag("aws.operation"), "ListFunctions")
-        assert_span_http_status_code(span, 200)
-        self.assertEqual(span.service, "aws.lambda")
-        self.assertEqual(span.resource, "lambda.listfunctions")
+        assert_tags(span, {"aws.region": "us-west-2", "aws.operation": "ListFunctions", http.STATUS_CODE: "200"})
+        assert span.service == "aws.lambda"
+        assert span.resource == "lambda.listfunctions"
 
     @mark_asyncio
-    def test_kms_client(self):
+    async def test_kms_client(self):
         with aiobotocore_client("kms", self.tracer) as kms:
-            yield from kms.list_keys(Limit=21)
+            await kms.list_keys(Limit=21)
 
         traces = self.pop_traces()
-        self.assertEqual(len(traces), 1)
-        self.assertEqual(len(traces[0]), 1)
+        assert len(traces) == 1
+        assert len(traces[0]) == 1
 
         span = traces[0][0]
 
         assert_is_measured(span)
-        self.assertEqual(span.get_tag("aws.region"), "us-west-2")
-        self.assertEqual(span.get_tag("aws.operation"), "ListKeys")
-        assert_span_http_status_code(span, 200)
-        self.assertEqual(span.service, "aws.kms")
-        self.assertEqual(span.resource, "kms.listkeys")
+        assert_tags(span, {"aws.region": "us-west-2", "aws.operation": "ListKeys", http.STATUS_CODE: "200"})
+        assert span.service == "aws.kms"
+        assert span.resource == "kms.listkeys"
         # checking for protection on STS against security leak
-        self.assertEqual(span.get_tag("params"), None)
+        assert "params" not in tag_keys(span)
 
     @mark_asyncio
-    def test_unpatch(self):
+    async def test_unpatch(self):
+        # re-patch on the way out since patching is now class-scoped
+        self.addCleanup(patch)
         unpatch()
         with aiobotocore_client("kinesis", self.tracer) as kinesis:
-            yield from kinesis.list_streams()
+            await kinesis.list_streams()
 
         traces = self.pop_traces()
-        self.assertEqual(len(traces), 0)
+        assert len(traces) == 0
 
     @mark_asyncio
-    def test_double_patch(self):
+    async def test_double_patch(self):
         patch()
         with aiobotocore_client("sqs", self.tracer) as sqs:
-            yield from sqs.list_queues()
+            await sqs.list_queues()
 
         traces = self.pop_traces()
-        self.assertEqual(len(traces), 1)
-        self.assertEqual(len(traces[0]), 1)
+        assert len(traces) == 1
+        assert len(traces[0]) == 1
 
     @mark_asyncio
-    def test_opentraced_client(self):
+    async def test_opentraced_client(self):
         from tests.opentracer.utils import init_tracer
 
         ot_tracer = init_tracer("my_svc", self.tracer)
 
         with ot_tracer.start_active_span("ot_outer_span"):
             with aiobotocore_client("ec2", self.tracer) as ec2:
-                yield from ec2.describe_instances()
+                await ec2.describe_instances()
 
         traces = self.pop_traces()
-        self.assertEqual(len(traces), 1)
-        self.assertEqual(len(traces[0]), 2)
+        assert len(traces) == 1
+        assert len(traces[0]) == 2
         ot_span = traces[0][0]
         dd_span = traces[0][1]
 
-        self.assertEqual(ot_span.resource, "ot_outer_span")
-        self.assertEqual(ot_span.service, "my_svc")
+        assert ot_span.resource == "ot_outer_span"
+        assert ot_span.service == "my_svc"
 
         # confirm the parenting
-        self.assertEqual(ot_span.parent_id, None)
-        self.assertEqual(dd_span.parent_id, ot_span.span_id)
+        assert ot_span.parent_id is None
+        assert dd_span.parent_id == ot_span.span_id
 
         assert_is_measured(dd_span)
-        self.assertEqual(dd_span.get_tag("aws.agent"), "aiobotocore")
-        self.assertEqual(dd_span.get_tag("aws.region"), "us-west-2")
-        self.assertEqual(dd_span.get_tag("aws.operation"), "DescribeInstances")
-        assert_span_http_status_code(dd_span, 200)
-        self.assertEqual(dd_span.get_metric("retry_attempts"), 0)
-        self.assertEqual(dd_span.service, "aws.ec2")
-        self.assertEqual(dd_span.resource, "ec2.describeinstances")
-        self.assertEqual(dd_span.name, "ec2.command")
+        assert_tags(
+            dd_span,
+            {
+                "aws.agent": "aiobotocore",
+                "aws.region": "us-west-2",
+                "aws.operation": "DescribeInstances",
+                http.STATUS_CODE: "200",
+            },
+        )
+        assert dd_span.get_metric("retry_attempts") == 0
+        assert dd_span.service == "aws.ec2"
+        assert dd_span.resource == "ec2.describeinstances"
+        assert dd_span.name == "ec2.command"
 
     @mark_asyncio
-    def test_opentraced_s3_client(self):
+    async def test_opentraced_s3_client(self):
         from tests.opentracer.utils import init_tracer
 
         ot_tracer = init_tracer("my_svc", self.tracer)
 
         with ot_tracer.start_active_span("ot_outer_span"):
             with aiobotocore_client("s3", self.tracer) as s3:
-                yield from s3.list_buckets()
+                await s3.list_buckets()
                 with ot_tracer.start_active_span("ot_inner_span1"):
-                    yield from s3.list_buckets()
+                    await s3.list_buckets()
                 with ot_tracer.start_active_span("ot_inner_span2"):
                     pass
 
         traces = self.pop_traces()
-        self.assertEqual(len(traces), 1)
-        self.assertEqual(len(traces[0]), 5)
+        assert len(traces) == 1
+        assert len(traces[0]) == 5
         ot_outer_span = traces[0][0]
         dd_span = traces[0][1]
         ot_inner_span = traces[0][2]
         dd_span2 = traces[0][3]
         ot_inner_span2 = traces[0][4]
 
-        self.assertEqual(ot_outer_span.resource, "ot_outer_span")
-        self.assertEqual(ot_inner_span.resource, "ot_inner_span1")
-        self.assertEqual(ot_inner_span2.resource, "ot_inner_span2")
+        assert ot_outer_span.resource == "ot_outer_span"
+        assert ot_inner_span.resource == "ot_inner_span1"
+        assert ot_inner_span2.resource == "ot_inner_span2"
 
         # confirm the parenting
-        self.assertEqual(ot_outer_span.parent_id, None)
-        self.assertEqual(dd_span.parent_id, ot_outer_span.span_id)
-        self.assertEqual(ot_inner_span.parent_id, ot_outer_span.span_id)
-        self.assertEqual(dd_span2.parent_id, ot_inner_span.span_id)
-        self.assertEqual(ot_inner_span2.parent_id, ot_outer_span.span_id)
+        assert ot_outer_span.parent_id is None
+        assert dd_span.parent_id == ot_outer_span.span_id
+        assert ot_inner_span.parent_id == ot_outer_span.span_id
+        assert dd_span2.parent_id == ot_inner_span.span_id
+        assert ot_inner_span2.parent_id == ot_outer_span.span_id
 
         assert_is_measured(dd_span)
-        self.assertEqual(dd_span.get_tag("aws.operation"), "ListBuckets")
-        assert_span_http_status_code(dd_span, 200)
-        self.assertEqual(dd_span.service, "aws.s3")
-        self.assertEqual(dd_span.resource, "s3.listbuckets")
-        self.assertEqual(dd_span.name, "s3.command")
-
-        self.assertEqual(dd_span2.get_tag("aws.operation"), "ListBuckets")
-        assert_span_http_status_code(dd_span2, 200)
-        self.assertEqual(dd_span2.service, "aws.s3")
-        self.assertEqual(dd_span2.resource, "s3.listbuckets")
-        self.assertEqual(dd_span2.name, "s3.command")
+        assert dd_span.get_tag("aws.operation") == "ListBuckets"
+        assert dd_span.get_tag(http.STATUS_CODE) == "200"
+        assert dd_span.service == "aws.s3"
+        assert dd_span.resource == "s3.listbuckets"
+        assert dd_span.name == "s3.command"
+
+        assert dd_span2.get_tag("aws.operation") == "ListBuckets"
+        assert dd_span2.get_tag(http.STATUS_CODE) == "200"
+        assert dd_span2.service == "aws.s3"
+        assert dd_span2.resource == "s3.listbuckets"
+        assert dd_span2.name == "s3.command"
 
     @mark_asyncio
     @AsyncioTestCase.run_in_subprocess(env_overrides=dict(DD_SERVICE="mysvc"))
-    def test_user_specified_service(self):
+    async def test_user_specified_service(self):
         """
         When a service name is specified by the user
             The aiobotocore integration should use it as the service name
         """
         with aiobotocore_client("ec2", self.tracer) as ec2:
-            yield from ec2.describe_instances()
+            await ec2.describe_instances()
 
         traces = self.pop_traces()
-        self.assertEqual(len(traces), 1)
-        self.assertEqual(len(traces[0]), 1)
+        assert len(traces) == 1
+        assert len(traces[0]) == 1
         span = traces[0][0]
 
         assert span.service == "mysvc"
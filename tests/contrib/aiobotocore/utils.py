@@ -1,17 +1,42 @@
 from contextlib import contextmanager
+import os
 
 import aiobotocore.session
 
 from ddtrace import Pin
 
 
+def _endpoint_port_base():
+    # The tests are independent, so they can be spread over multiple cores
+    # with pytest-xdist as long as each worker talks to its own localstack
+    # stack: worker gwN expects a stack listening on ports base+10*N to
+    # base+10*N+5 (same service order as LOCALSTACK_ENDPOINT_URL below).
+    # docker-compose only starts the stack for gw0 (ports 5000-5005); to run
+    # with `pytest -n N` start one moto/localstack stack per extra worker at
+    # the shifted ports, e.g. for gw1:
+    #
+    #   moto_server s3 -p 5010 & moto_server ec2 -p 5011 & ...
+    #
+    # A plain (non-xdist) run keeps using the docker-compose stack unchanged.
+    base = int(os.environ.get("TEST_LOCALSTACK_PORT_BASE", 5000))
+    worker = os.environ.get("PYTEST_XDIST_WORKER")  # e.g. "gw3"
+    if worker:
+        try:
+            base += 10 * int(worker.lstrip("gw"))
+        except ValueError:
+            pass
+    return base
+
+
+_port_base = _endpoint_port_base()
+
 LOCALSTACK_ENDPOINT_URL = {
-    "s3": "http://localhost:5000",
-    "ec2": "http://localhost:5001",
-    "kms": "http://localhost:5002",
-    "sqs": "http://localhost:5003",
-    "lambda": "http://localhost:5004",
-    "kinesis": "http://localhost:5005",
+    "s3": "http://localhost:%d" % _port_base,
+    "ec2": "http://localhost:%d" % (_port_base + 1),
+    "kms": "http://localhost:%d" % (_port_base + 2),
+    "sqs": "http://localhost:%d" % (_port_base + 3),
+    "lambda": "http://localhost:%d" % (_port_base + 4),
+    "kinesis": "http://localhost:%d" % (_port_base + 5),
 }
 
 
@@ -20,6 +45,9 @@ def aiobotocore_client(service, tracer):
     """Helper function that creates a new aiobotocore client so that
     it is closed at the end of the context manager.
     """
+    # DEV: the session must be created per call: on aiobotocore < 0.12
+    # get_session() captures the current event loop and AsyncioTestCase
+    # gives each test a fresh one
     session = aiobotocore.session.get_session()
     endpoint = LOCALSTACK_ENDPOINT_URL[service]
     client = session.create_client(
@@ -30,6 +30,9 @@ from tests.utils import assert_span_http_status_code
 # Parse botocore.__version_ from "1.9.0" to (1, 9, 0)
 BOTOCORE_VERSION = tuple(int(x) for x in botocore.__version__.split("."))
 
+# every lambda invoke test sends the same empty payload; serialize it once
+EMPTY_PAYLOAD = json.dumps({})
+
 
 def get_zip_lambda():
     code = """
@@ -44,6 +47,23 @@ def lambda_handler(event, context):
     return zip_output.read()
 
 
+# the deployment package is identical for every lambda test; build it once
+LAMBDA_ZIP = get_zip_lambda()
+
+
+def create_lambda_function(client, name):
+    client.create_function(
+        FunctionName=name,
+        Runtime="python3.7",
+        Role="test-iam-role",
+        Handler="lambda_function.lambda_handler",
+        Code={"ZipFile": LAMBDA_ZIP},
+        Publish=True,
+        Timeout=30,
+        MemorySize=128,
+    )
+
+
 class BotocoreTest(TracerTestCase):
     """Botocore integration testsuite"""
 
@@ -482,24 +502,13 @@ class BotocoreTest(TracerTestCase):
     @mock_lambda
     def test_lambda_invoke_no_context_client(self):
         lamb = self.session.create_client("lambda", region_name="us-west-2", endpoint_url="http://localhost:4566")
-        lamb.create_function(
-            FunctionName="ironmaiden",
-            Runtime="python3.7",
-            Role="test-iam-role",
-            Handler="lambda_function.lambda_handler",
-            Code={
-                "ZipFile": get_zip_lambda(),
-            },
-            Publish=True,
-            Timeout=30,
-            MemorySize=128,
-        )
+        create_lambda_function(lamb, "ironmaiden")
 
         Pin(service=self.TEST_SERVICE, tracer=self.tracer).onto(lamb)
 
         lamb.invoke(
             FunctionName="ironmaiden",
-            Payload=json.dumps({}),
+            Payload=EMPTY_PAYLOAD,
         )
 
         spans = self.get_spans()
@@ -526,24 +535,13 @@ class BotocoreTest(TracerTestCase):
     def test_lambda_invoke_distributed_tracing_off(self):
         with self.override_config("botocore", dict(distributed_tracing=False)):
             lamb = self.session.create_client("lambda", region_name="us-west-2", endpoint_url="http://localhost:4566")
-            lamb.create_function(
-                FunctionName="ironmaiden",
-                Runtime="python3.7",
-                Role="test-iam-role",
-                Handler="lambda_function.lambda_handler",
-                Code={
-                    "ZipFile": get_zip_lambda(),
-                },
-                Publish=True,
-                Timeout=30,
-                MemorySize=128,
-            )
+            create_lambda_function(lamb, "ironmaiden")
 
             Pin(service=self.TEST_SERVICE, tracer=self.tracer).onto(lamb)
 
             lamb.invoke(
                 FunctionName="ironmaiden",
-                Payload=json.dumps({}),
+                Payload=EMPTY_PAYLOAD,
             )
 
             spans = self.get_spans()
@@ -563,18 +561,7 @@ class BotocoreTest(TracerTestCase):
     @mock_lambda
     def test_lambda_invoke_with_context_client(self):
         lamb = self.session.create_client("lambda", region_name="us-west-2", endpoint_url="http://localhost:4566")
-        lamb.create_function(
-            FunctionName="megadeth",
-            Runtime="python3.7",
-            Role="test-iam-role",
-            Handler="lambda_function.lambda_handler",
-            Code={
-                "ZipFile": get_zip_lambda(),
-            },
-            Publish=True,
-            Timeout=30,
-            MemorySize=128,
-        )
+        create_lambda_function(lamb, "megadeth")
         client_context = base64.b64encode(json.dumps({"custom": {"foo": "bar"}}).encode()).decode()
 
         Pin(service=self.TEST_SERVICE, tracer=self.tracer).onto(lamb)
@@ -582,7 +569,7 @@ class BotocoreTest(TracerTestCase):
         lamb.invoke(
             FunctionName="megadeth",
             ClientContext=client_context,
-            Payload=json.dumps({}),
+            Payload=EMPTY_PAYLOAD,
         )
 
         spans = self.get_spans()
@@ -609,25 +596,14 @@ class BotocoreTest(TracerTestCase):
     @mock_lambda
     def test_lambda_invoke_bad_context_client(self):
         lamb = self.session.create_client("lambda", region_name="us-west-2", endpoint_url="http://localhost:4566")
-        lamb.create_function(
-            FunctionName="black-sabbath",
-            Runtime="python3.7",
-            Role="test-iam-role",
-            Handler="lambda_function.lambda_handler",
-            Code={
-                "ZipFile": get_zip_lambda(),
-            },
-            Publish=True,
-            Timeout=30,
-            MemorySize=128,
-        )
+        create_lambda_function(lamb, "black-sabbath")
 
         Pin(service=self.TEST_SERVICE, tracer=self.tracer).onto(lamb)
 
         lamb.invoke(
             FunctionName="black-sabbath",
             ClientContext="bad_client_context",
-            Payload=json.dumps({}),
+            Payload=EMPTY_PAYLOAD,
         )
 
         spans = self.get_spans()
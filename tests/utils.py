@@ -48,6 +48,17 @@ def assert_span_http_status_code(span, code):
     assert tag == code, "%r != %r" % (tag, code)
 
 
+def assert_tags(span, expected):
+    """Assert in bulk that the span has the expected tag values"""
+    actual = {key: span.get_tag(key) for key in expected}
+    assert actual == expected, "%r != %r" % (actual, expected)
+
+
+def tag_keys(span):
+    """Return the span's tag names, for (bulk) membership asserts"""
+    return frozenset(span.meta)
+
+
 @contextlib.contextmanager
 def override_env(env):
     """